@@ -1,31 +1,148 @@
 print(">>> quickstart.py is running...")
 
 # ------------------ Imports ------------------
+import atexit
 import csv
+import functools
+import hashlib
 import json
+import queue
+import re
 import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from io import BytesIO
 from pathlib import Path
 from typing import List, Optional
 
+from dataclasses import dataclass
 from datetime import datetime, timezone
 import feedparser           # pip install feedparser
 import httpx                # pip install httpx
-from selectolax.parser import HTMLParser
-from pydantic import BaseModel, HttpUrl
+from lxml import etree      # pip install lxml
+# Lexbor backend: same node API as selectolax.parser but a substantially
+# faster HTML engine, which matters on the big team-site archive pages.
+from selectolax.lexbor import LexborHTMLParser as HTMLParser
 import urllib.parse
 from urllib.parse import urlsplit, urlunsplit
 
+try:
+    from orjson import loads as _json_loads   # pip install orjson (optional, ~5x faster)
+except ImportError:
+    _json_loads = json.loads
+
+
+# ------------------ HTTP client -----------------
+# One shared client for every fetch in the module: keep-alive connection
+# pooling means hosts we hit repeatedly (Google News, team-site CDNs) only
+# pay the TCP+TLS handshake once. httpx.Client is thread-safe, so the
+# ingestion thread pool can share it.
+# Ask explicitly for compressed bodies — RSS/HTML compress 3-5x and not
+# every server compresses unless asked. Only advertise codings httpx can
+# actually decode here: brotli/zstd join the list when their (optional)
+# decoder packages are installed.
+_ACCEPT_ENCODING = "gzip, deflate"
+try:
+    import brotli  # noqa: F401  pip install brotli (optional)
+    _ACCEPT_ENCODING += ", br"
+except ImportError:
+    pass
+try:
+    import zstandard  # noqa: F401  pip install zstandard (optional)
+    _ACCEPT_ENCODING += ", zstd"
+except ImportError:
+    pass
+
+HTTP_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                  "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36 DelphiEdgeScraper/1.0",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": _ACCEPT_ENCODING,
+}
+_CLIENT = httpx.Client(
+    timeout=10.0,
+    follow_redirects=True,
+    headers=HTTP_HEADERS,
+    limits=httpx.Limits(max_keepalive_connections=32),
+    transport=httpx.HTTPTransport(retries=3),  # connect-level retries
+)
+atexit.register(_CLIENT.close)
+
+# Transient server-side statuses worth one more try after a short backoff.
+_RETRY_STATUS = (429, 500, 502, 503, 504)
+_RETRY_ATTEMPTS = 3
+_RETRY_BACKOFF = 0.5
+
+class _HostLimiter:
+    """Enforce a minimum interval between requests to the same host.
+
+    The concurrent fetch phase would otherwise dogpile single origins —
+    Reddit, Google News and the Sidearm CDNs serve most of our URLs — and
+    trade the latency win for 429 throttling stalls. Each caller books the
+    host's next free slot under the lock, then sleeps outside it.
+    """
+    def __init__(self, min_interval: float = 1.0):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_at: dict[str, float] = {}
+
+    def wait(self, url: str) -> None:
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            at = max(now, self._next_at.get(host, 0.0))
+            self._next_at[host] = at + self.min_interval
+        if at > now:
+            time.sleep(at - now)
+
+_LIMITER = _HostLimiter()
+
+def _request(method: str, url: str, **kwargs) -> httpx.Response:
+    """Rate-limited request through the shared keep-alive client.
+
+    Retries throttling/5xx responses and transport hiccups with exponential
+    backoff (0.5s, 1s) before giving up, mirroring urllib3's
+    Retry(total=3, backoff_factor=0.5, status_forcelist=...) behavior.
+    """
+    _LIMITER.wait(url)
+    for attempt in range(_RETRY_ATTEMPTS):
+        last_try = attempt == _RETRY_ATTEMPTS - 1
+        try:
+            resp = _CLIENT.request(method, url, **kwargs)
+        except httpx.TransportError:
+            if last_try:
+                raise
+        else:
+            if resp.status_code not in _RETRY_STATUS or last_try:
+                return resp
+        time.sleep(_RETRY_BACKOFF * (2 ** attempt))
+    raise AssertionError("unreachable")
+
+def _get(url: str, **kwargs) -> httpx.Response:
+    """Rate-limited GET through the shared keep-alive client."""
+    return _request("GET", url, **kwargs)
+
+def _head(url: str, **kwargs) -> httpx.Response:
+    """Rate-limited HEAD through the shared keep-alive client."""
+    return _request("HEAD", url, **kwargs)
+
 
 # ------------------ Data model ------------------
-class Article(BaseModel):
+# A plain slotted dataclass: every scraped link and RSS entry builds one of
+# these, and the only consumer is upsert(), which stringifies the fields
+# anyway — pydantic's per-field validation was pure overhead in the hot
+# loops. URL sanity is a cheap startswith check at the construction sites.
+@dataclass(slots=True)
+class Article:
     title: str
-    url: HttpUrl
+    url: str
+    fetched_at: str              # ISO-8601 UTC, computed once per feed/page
+    source: str
     published_at: Optional[datetime] = None
     author: Optional[str] = None
     summary: Optional[str] = None
     tags: Optional[list[str]] = None
-    fetched_at: datetime
-    source: str
 
 # ------------------ Storage ---------------------
 DB_PATH = Path("data/delphi_edge.db")
@@ -43,72 +160,252 @@ CREATE TABLE IF NOT EXISTS articles (
     fetched_at TEXT NOT NULL,
     source TEXT NOT NULL
 );
+
+CREATE TABLE IF NOT EXISTS feed_meta (
+    url TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    body_sha1 TEXT
+);
 """
 
+_UPSERT_SQL = """INSERT INTO articles (title, url, published_at, author, summary, tags, fetched_at, source)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(url) DO UPDATE SET
+  title=excluded.title,
+  published_at=excluded.published_at,
+  author=excluded.author,
+  summary=excluded.summary,
+  tags=excluded.tags,
+  fetched_at=excluded.fetched_at,
+  source=excluded.source
+WHERE articles.title IS NOT excluded.title
+   OR articles.published_at IS NOT excluded.published_at
+   OR articles.author IS NOT excluded.author
+   OR articles.summary IS NOT excluded.summary
+   OR articles.tags IS NOT excluded.tags
+   OR articles.source IS NOT excluded.source;"""
+
+# Above this many rows, upsert stages the batch into an unindexed TEMP
+# table and merges once, so the UNIQUE(url) index is maintained in bulk
+# instead of per inserted row.
+_STAGING_THRESHOLD = 5000
+
+_STAGING_MERGE_SQL = """INSERT INTO articles (title, url, published_at, author, summary, tags, fetched_at, source)
+SELECT title, url, published_at, author, summary, tags, fetched_at, source FROM stg WHERE true
+ON CONFLICT(url) DO UPDATE SET
+  title=excluded.title,
+  published_at=excluded.published_at,
+  author=excluded.author,
+  summary=excluded.summary,
+  tags=excluded.tags,
+  fetched_at=excluded.fetched_at,
+  source=excluded.source
+WHERE articles.title IS NOT excluded.title
+   OR articles.published_at IS NOT excluded.published_at
+   OR articles.author IS NOT excluded.author
+   OR articles.summary IS NOT excluded.summary
+   OR articles.tags IS NOT excluded.tags
+   OR articles.source IS NOT excluded.source;"""
+
+_DB_LOCK = threading.Lock()
+_DB_CONN: "sqlite3.Connection | None" = None
+
+def _connect() -> sqlite3.Connection:
+    """Return the shared, long-lived articles DB connection.
+
+    Created lazily on first use with the PRAGMAs this write-mostly workload
+    wants: WAL mode lets readers coexist with the writer, synchronous=NORMAL
+    halves the fsyncs per commit (safe in WAL), and the temp/cache settings
+    keep sort/index scratch space in memory. Keeping one connection alive
+    also means sqlite3's per-connection statement cache keeps the upsert
+    statement compiled across calls. Writers must serialize on _DB_LOCK.
+    """
+    global _DB_CONN
+    with _DB_LOCK:
+        if _DB_CONN is None:
+            DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL;")
+            conn.execute("PRAGMA synchronous=NORMAL;")
+            conn.execute("PRAGMA temp_store=MEMORY;")
+            conn.execute("PRAGMA cache_size=-65536;")
+            _DB_CONN = conn
+    return _DB_CONN
+
 def init_db():
     print(">>> init_db")
-    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with sqlite3.connect(DB_PATH) as conn:
-        conn.execute(SCHEMA)
+    with _connect() as conn:
+        conn.executescript(SCHEMA)
+
+def _load_feed_meta(url: str):
+    conn = _connect()
+    with _DB_LOCK:
+        row = conn.execute(
+            "SELECT etag, last_modified, body_sha1 FROM feed_meta WHERE url=?", (url,)
+        ).fetchone()
+    return row if row else (None, None, None)
+
+def _save_feed_meta(url: str, etag, last_modified, body_sha1):
+    conn = _connect()
+    with _DB_LOCK, conn:
+        conn.execute(
+            """INSERT INTO feed_meta (url, etag, last_modified, body_sha1)
+               VALUES (?, ?, ?, ?)
+               ON CONFLICT(url) DO UPDATE SET
+                 etag=excluded.etag,
+                 last_modified=excluded.last_modified,
+                 body_sha1=excluded.body_sha1;""",
+            (url, etag, last_modified, body_sha1)
+        )
 
 def upsert(articles: List[Article]):
     print(f">>> upsert {len(articles)} rows")
     if not articles:
         return
-    with sqlite3.connect(DB_PATH) as conn, conn:
-        for a in articles:
+    # Rows are generated lazily straight into executemany, so the batch is
+    # never materialized a second time as a list of tuples.
+    rows = (
+        (
+            a.title, a.url,
+            a.published_at.isoformat() if a.published_at else None,
+            a.author, a.summary,
+            ",".join(a.tags) if a.tags else None,
+            a.fetched_at, a.source
+        )
+        for a in articles
+    )
+    # One prepared statement + one transaction for the whole batch; per-row
+    # execute() re-parses the SQL and fsyncs every statement. The lock keeps
+    # concurrent callers from interleaving transactions on the shared
+    # connection.
+    conn = _connect()
+    with _DB_LOCK, conn:
+        if len(articles) < _STAGING_THRESHOLD:
+            conn.executemany(_UPSERT_SQL, rows)
+        else:
+            # Bulk path: temp_store=MEMORY keeps the staging table off disk.
             conn.execute(
-                """INSERT INTO articles (title, url, published_at, author, summary, tags, fetched_at, source)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                   ON CONFLICT(url) DO UPDATE SET
-                     title=excluded.title,
-                     published_at=excluded.published_at,
-                     author=excluded.author,
-                     summary=excluded.summary,
-                     tags=excluded.tags,
-                     fetched_at=excluded.fetched_at,
-                     source=excluded.source;""",
-                (
-                    a.title, str(a.url),
-                    a.published_at.isoformat() if a.published_at else None,
-                    a.author, a.summary,
-                    ",".join(a.tags) if a.tags else None,
-                    a.fetched_at.isoformat(), a.source
-                )
+                "CREATE TEMP TABLE stg "
+                "(title, url, published_at, author, summary, tags, fetched_at, source)"
             )
+            conn.executemany("INSERT INTO stg VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            conn.execute(_STAGING_MERGE_SQL)
+            conn.execute("DROP TABLE stg")
 
 def export_csv():
     print(">>> export_csv")
-    with sqlite3.connect(DB_PATH) as conn:
-        rows = conn.execute(
-            "SELECT title, url, published_at, author, summary, tags, fetched_at, source "
-            "FROM articles ORDER BY id DESC"
-        ).fetchall()
     CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with open(CSV_PATH, "w", newline="", encoding="utf-8") as f:
+    # Stream straight from the cursor into the writer so the whole table is
+    # never resident as a Python list; the big buffer batches file writes.
+    with _connect() as conn, open(CSV_PATH, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
         writer = csv.writer(f)
         writer.writerow(["title","url","published_at","author","summary","tags","fetched_at","source"])
-        writer.writerows(rows)
+        cur = conn.execute(
+            "SELECT title, url, published_at, author, summary, tags, fetched_at, source "
+            "FROM articles ORDER BY id DESC"
+        )
+        writer.writerows(cur)
 
 # ------------------ RSS ingestion ----------------
+def _fast_parse(content: bytes) -> list[dict]:
+    """Pull title/link/author/summary out of an RSS or Atom feed.
+
+    That is the only subset of the feed we ever read, so a streaming
+    libxml2 (lxml.etree.iterparse) pass beats feedparser's generic
+    sanitizing parser by a wide margin on big Google News feeds. Elements
+    are cleared as they complete to keep memory flat. Raises
+    etree.XMLSyntaxError on malformed XML; callers fall back to feedparser
+    for those feeds.
+    """
+    entries: list[dict] = []
+    for _, elem in etree.iterparse(BytesIO(content), events=("end",)):
+        tag = elem.tag
+        if not isinstance(tag, str):
+            continue  # comments / processing instructions
+        if tag.rsplit("}", 1)[-1] not in ("item", "entry"):
+            continue
+        entry: dict = {}
+        for child in elem:
+            ctag = child.tag
+            if not isinstance(ctag, str):
+                continue
+            ctag = ctag.rsplit("}", 1)[-1]
+            if ctag == "title":
+                entry["title"] = child.text or ""
+            elif ctag == "link" and not entry.get("link"):
+                # RSS carries the URL as text, Atom as an href attribute
+                entry["link"] = (child.text or child.get("href") or "").strip()
+            elif ctag in ("author", "creator"):
+                entry["author"] = "".join(child.itertext()).strip() or None
+            elif ctag in ("summary", "description"):
+                entry["summary"] = child.text
+        entries.append(entry)
+        # free this item plus any processed siblings still held by the parent
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+    return entries
+
+def _parse_entries(body: bytes) -> list:
+    """Parse feed bytes into entry dicts, falling back to feedparser.
+
+    Top-level and dependent only on its argument, so it can be shipped to a
+    ProcessPoolExecutor unchanged if parse CPU ever dominates; today the
+    fast path is C-level ElementTree running in pool threads, which release
+    the GIL for most of the work, so processes would only add pickling
+    overhead.
+    """
+    try:
+        return _fast_parse(body)
+    except etree.XMLSyntaxError:
+        return feedparser.parse(body).entries
+
 def rss_to_articles(feed_url: str, source: str, default_tags: list[str] | None = None) -> list[Article]:
     print(f">>> Fetching RSS: {feed_url}")
     try:
-        feed = feedparser.parse(feed_url)
+        # Conditional GET: most feeds are unchanged between cron cycles, and
+        # a 304 costs ~0 bytes and skips the parse entirely.
+        etag, last_modified, old_sha = _load_feed_meta(feed_url)
+        cond_headers = {}
+        if etag:
+            cond_headers["If-None-Match"] = etag
+        if last_modified:
+            cond_headers["If-Modified-Since"] = last_modified
+        # Fetch the bytes ourselves so the shared client's connection pool is
+        # reused; feedparser's own URL path opens a fresh connection per feed.
+        resp = _get(feed_url, headers=cond_headers or None)
+        if resp.status_code == 304:
+            print(f">>> RSS {source}: not modified (304)")
+            return []
+        resp.raise_for_status()
+        body = resp.content
+        body_sha = hashlib.sha1(body).hexdigest()
+        _save_feed_meta(feed_url, resp.headers.get("etag"),
+                        resp.headers.get("last-modified"), body_sha)
+        if old_sha is not None and body_sha == old_sha:
+            # covers servers that ignore the conditional headers
+            print(f">>> RSS {source}: body unchanged")
+            return []
+        entries = _parse_entries(body)
         out: list[Article] = []
-        for e in feed.entries:
+        # one timestamp per feed, not one syscall per entry
+        now = datetime.now(timezone.utc).isoformat()
+        for e in entries:
             title = (e.get("title") or "").strip()
             link  = (e.get("link")  or "").strip()
             if not title or not link:
                 continue
+            if not link.startswith(("http://", "https://")):
+                continue
             out.append(Article(
                 title=title,
                 url=link,
                 published_at=None,                           # parse later if needed
-                author=getattr(e, "author", None),
-                summary=getattr(e, "summary", None),
+                author=e.get("author"),
+                summary=e.get("summary"),
                 tags=default_tags,
-                fetched_at=datetime.now(timezone.utc),
+                fetched_at=now,
                 source=source
             ))
         print(f">>> RSS {source}: {len(out)} items")
@@ -124,8 +421,7 @@ from urllib.parse import urlparse
 def load_feeds_json(path: str = "feeds.json") -> list[dict]:
     """Load an array of {url, source?, tags?} from feeds.json."""
     try:
-        text = Path(path).read_text(encoding="utf-8")
-        data = json.loads(text)
+        data = _json_loads(Path(path).read_bytes())
         # Support either a raw list or an object with a top-level list key.
         if isinstance(data, dict):
             # try common keys if user wrapped it
@@ -143,9 +439,16 @@ def load_feeds_json(path: str = "feeds.json") -> list[dict]:
         print(">>> ERROR loading feeds.json:", e)
         return []
 
-def ingest_feeds_with_logging(feeds: list[dict], label_prefix: str = "") -> list[Article]:
-    """Fetch all feeds, print counts, return collected Article objects."""
+def ingest_feeds_with_logging(feeds: list[dict], label_prefix: str = "",
+                              sink=None) -> list[Article]:
+    """Fetch all feeds concurrently, print counts, return collected Article objects.
+
+    When a `sink` callable is given, each feed's articles are handed to it
+    as soon as that feed completes (and the returned list stays empty), so
+    downstream work can overlap the remaining fetches.
+    """
     collected: list[Article] = []
+    jobs: list[tuple[str, str, list[str]]] = []
     for f in feeds:
         url = f.get("url", "").strip()
         if not url:
@@ -156,71 +459,156 @@ def ingest_feeds_with_logging(feeds: list[dict], label_prefix: str = "") -> list
             u = urlparse(url)
             source = f"{u.scheme}://{u.netloc}" if u.scheme and u.netloc else url
         tags = f.get("tags") or []
-        items_found = rss_to_articles(url, source, tags if isinstance(tags, list) else [str(tags)])
-        # Build a friendly label
-        if tags:
-            label = " ".join(tags)
-        else:
-            host = urlparse(url).netloc or source
-            label = host
-        if label_prefix:
-            label = f"{label_prefix} {label}"
-        print(f">>> {label}: {len(items_found)} items from {url}")
-        collected += items_found
+        jobs.append((url, source, tags if isinstance(tags, list) else [str(tags)]))
+
+    if not jobs:
+        return collected
+
+    # Feed fetching is I/O-bound, so fan the blocking fetches out over a
+    # thread pool and collect results as they finish.
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        futures = {pool.submit(rss_to_articles, url, source, tags): (url, source, tags)
+                   for url, source, tags in jobs}
+        for fut in as_completed(futures):
+            url, source, tags = futures[fut]
+            items_found = fut.result()
+            # Build a friendly label
+            if tags:
+                label = " ".join(tags)
+            else:
+                host = urlparse(url).netloc or source
+                label = host
+            if label_prefix:
+                label = f"{label_prefix} {label}"
+            print(f">>> {label}: {len(items_found)} items from {url}")
+            if sink is not None:
+                sink(items_found)
+            else:
+                collected += items_found
     return collected
 
 
 
-def fetch_html(url: str) -> str:
+def fetch_page(url: str) -> httpx.Response:
+    # Shared client: repeated hits on the same host (sidearm CDNs especially)
+    # reuse the pooled connection instead of paying a TLS handshake per page.
     headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-                      "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36 DelphiEdgeScraper/1.0",
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.9",
         "Cache-Control": "no-cache",
         "Pragma": "no-cache",
-        "Connection": "keep-alive",
     }
-    with httpx.Client(timeout=30.0, follow_redirects=True, headers=headers) as client:
-        r = client.get(url)
-        r.raise_for_status()
-        return r.text
+    r = _get(url, timeout=30.0, headers=headers)
+    r.raise_for_status()
+    return r
+
+def fetch_bytes(url: str) -> bytes:
+    # Raw bytes skip the decoded-str copy of the whole body; selectolax
+    # parses bytes and sniffs the encoding itself.
+    return fetch_page(url).content
+
+
+# Default deny list for team-site archive links: navigation, commerce and
+# media pages that are never stories. Module-level so it is built once.
+DENY_SUBSTRINGS = (
+    "/roster", "/schedule", "/stats", "/tickets", "evenue", "shop.",
+    "/media-guide", "/coaches", "/facilities", "calendar", "gatornetwork",
+    "/photo", "/gallery", "/podcast", "/video", "/store", "/promo"
+)
+
+@functools.lru_cache(maxsize=None)
+def _substring_union(substrings: tuple) -> "re.Pattern[str] | None":
+    """Compile a tuple of plain substrings into one alternation regex.
+
+    A single C-level search replaces an O(len(href) * len(list)) pass of
+    Python `in` checks per link — the same single-scan multi-pattern match
+    an Aho-Corasick automaton would give, without a new dependency. Cached
+    per tuple so each archive's allow/deny lists compile exactly once.
+    """
+    if not substrings:
+        return None
+    return re.compile("|".join(re.escape(x) for x in substrings))
+
+_DENY_RE = _substring_union(DENY_SUBSTRINGS)
 
+# Selectors of the shape a[href*='...'] are just a substring test on the href
+# attribute; recognizing them lets scrape_links walk every <a> tag directly
+# instead of routing the page through the CSS selector engine.
+_HREF_ATTR_SEL = re.compile(r"^a\[href\*='([^']+)'\]$")
 
 def scrape_links(url: str, source: str, link_sel: str, tags: list[str],
                  allow_substrings: list[str] | None = None,
                  deny_substrings: list[str] | None = None) -> list[Article]:
     print(f">>> Scraping HTML: {url}")
     try:
-        html = fetch_html(url)
-        t = HTMLParser(html)
+        # Archive pages change rarely between runs; a HEAD probe against the
+        # stored Last-Modified (same feed_meta table the RSS path uses) skips
+        # the full GET + parse when the server says nothing moved. The body
+        # hash below catches servers that omit or lie about Last-Modified.
+        _, old_lm, old_sha = _load_feed_meta(url)
+        if old_lm:
+            try:
+                h = _head(url, timeout=10.0)
+                if h.status_code == 200 and h.headers.get("last-modified") == old_lm:
+                    print(f">>> HTML unchanged (Last-Modified), skipping: {url}")
+                    return []
+            except httpx.HTTPError:
+                pass  # HEAD not supported or flaky — fall through to the GET
+
+        r = fetch_page(url)
+        body = r.content
+        body_sha = hashlib.sha1(body).hexdigest()
+        _save_feed_meta(url, r.headers.get("etag"),
+                        r.headers.get("last-modified"), body_sha)
+        if old_sha is not None and body_sha == old_sha:
+            print(f">>> HTML unchanged (body hash), skipping: {url}")
+            return []
+
+        t = HTMLParser(body)
         out: list[Article] = []
 
-        allow_substrings = allow_substrings or []
-        deny_substrings = deny_substrings or [
-            "/roster", "/schedule", "/stats", "/tickets", "evenue", "shop.",
-            "/media-guide", "/coaches", "/facilities", "calendar", "gatornetwork",
-            "/photo", "/gallery", "/podcast", "/video", "/store", "/promo"
-        ]
+        # Hoist everything that is constant for the page out of the per-link
+        # predicate: looks_like_story runs once per anchor, and archive pages
+        # carry hundreds of them.
+        src_lower = source.lower()
+        allow_re = _substring_union(tuple(allow_substrings)) if allow_substrings else None
+        deny_re = _substring_union(tuple(deny_substrings)) if deny_substrings else _DENY_RE
 
         def looks_like_story(href: str) -> bool:
             h = href.lower()
-            if not h.startswith("http"):
+            # str.startswith with a tuple covers the scheme and source checks
+            # in C; the compiled unions scan h once per list instead of once
+            # per substring.
+            if not h.startswith(("http://", "https://")):
                 return False
-            if not h.startswith(source.lower()):
+            if not h.startswith(src_lower):
                 return False
-            if any(x in h for x in deny_substrings):
+            if deny_re.search(h):
                 return False
-            if allow_substrings and not any(x in h for x in allow_substrings):
+            if allow_re is not None and not allow_re.search(h):
                 return False
             # heuristic: story slugs usually have hyphens in the last path segment
             last = h.rstrip("/").split("/")[-1]
             return "-" in last and len(last) > 8
 
-        for a in t.css(link_sel):
-            title = a.text(strip=True)
+        # one timestamp per page, not one syscall per link
+        now = datetime.now(timezone.utc).isoformat()
+
+        sel_match = _HREF_ATTR_SEL.match(link_sel)
+        if sel_match:
+            nodes = t.tags("a")
+            href_sub = sel_match.group(1)
+        else:
+            nodes = t.css(link_sel)
+            href_sub = None
+
+        for a in nodes:
             href = a.attributes.get("href", "")
-            if not title or not href:
+            if not href:
+                continue
+            if href_sub is not None and href_sub not in href:
+                continue
+            title = a.text(strip=True)
+            if not title:
                 continue
             if href.startswith("/"):
                 href = source.rstrip("/") + href
@@ -232,7 +620,7 @@ def scrape_links(url: str, source: str, link_sel: str, tags: list[str],
                     author=None,
                     summary=None,
                     tags=tags,
-                    fetched_at=datetime.now(timezone.utc),
+                    fetched_at=now,
                     source=source
                 ))
         
@@ -242,17 +630,36 @@ def scrape_links(url: str, source: str, link_sel: str, tags: list[str],
         print(f">>> HTML Error for {url}: {e}")
         return []
     
+def scrape_sidearm(url: str, source: str, tags: list[str]) -> list[Article]:
+    """Scrape a Sidearm-platform team news page (the /sports/football/news layout)."""
+    return scrape_links(url, source, "a[href*='/news/']", tags)
+
+
+# Search-URL template shared by every Google News feed; only the quoted
+# query varies per call.
+_GN_SEARCH_URL = "https://news.google.com/rss/search?q={q}&hl=en-US&gl=US&ceid=US:en"
+
+@functools.lru_cache(maxsize=None)
 def google_news_feed(query: str, tag: str):
     """
     Build a Google News RSS feed URL for a given search query.
     Example: google_news_feed("Alabama Crimson Tide football", "TEAM Alabama")
+
+    Cached: the same team queries recur across the FANTASY_/BETTING_/LOCAL
+    lists, so repeated calls skip the quote_plus work and return the same
+    tuple, which makes URL-level dedupe downstream trivial.
     """
-    q = urllib.parse.quote_plus(query)
-    url = f"https://news.google.com/rss/search?q={q}&hl=en-US&gl=US&ceid=US:en"
+    url = _GN_SEARCH_URL.format(q=urllib.parse.quote_plus(query))
     return (url, "Google News", [tag, "LOCAL"])
 
 
+@functools.lru_cache(maxsize=4096)
 def canonicalize(u: str) -> str:
+    # Most URLs carry no query/fragment, so skip the split/unsplit round
+    # trip entirely on that fast path; the cache covers feeds that keep
+    # re-surfacing the same URLs across runs.
+    if "?" not in u and "#" not in u:
+        return u
     sp = urlsplit(u)
     # drop query/fragment noise; keep path
     return urlunsplit((sp.scheme, sp.netloc, sp.path, "", ""))
@@ -313,26 +720,15 @@ YAHOO_CFB = "https://sports.yahoo.com/college-football/rss.xml"
 CBS_NFL   = "https://www.cbssports.com/rss/headlines/nfl/"
 CBS_CFB   = "https://www.cbssports.com/rss/headlines/ncaa-fb/"
 
-# inside main()
-print(">>> Yahoo NFL:", end=" ")
-ya_nfl = rss_to_articles(YAHOO_NFL, "https://sports.yahoo.com", ["Yahoo","NFL"])
-print(f"{len(ya_nfl)} items from {YAHOO_NFL}")
-items += ya_nfl
-
-print(">>> Yahoo CFB:", end=" ")
-ya_cfb = rss_to_articles(YAHOO_CFB, "https://sports.yahoo.com", ["Yahoo","CFB"])
-print(f"{len(ya_cfb)} items from {YAHOO_CFB}")
-items += ya_cfb
-
-print(">>> CBS NFL:", end=" ")
-cbs_nfl = rss_to_articles(CBS_NFL, "https://www.cbssports.com", ["CBS","NFL"])
-print(f"{len(cbs_nfl)} items from {CBS_NFL}")
-items += cbs_nfl
-
-print(">>> CBS CFB:", end=" ")
-cbs_cfb = rss_to_articles(CBS_CFB, "https://www.cbssports.com", ["CBS","CFB"])
-print(f"{len(cbs_cfb)} items from {CBS_CFB}")
-items += cbs_cfb
+# Ingested from main() via ingest_feeds_with_logging so the fetches run on
+# the thread pool; this used to be a stray top-level block that fired four
+# network requests at import time.
+EXTRA_RSS = [
+    {"url": YAHOO_NFL, "source": "https://sports.yahoo.com", "tags": ["Yahoo","NFL"]},
+    {"url": YAHOO_CFB, "source": "https://sports.yahoo.com", "tags": ["Yahoo","CFB"]},
+    {"url": CBS_NFL,   "source": "https://www.cbssports.com", "tags": ["CBS","NFL"]},
+    {"url": CBS_CFB,   "source": "https://www.cbssports.com", "tags": ["CBS","CFB"]},
+]
 
 
 # SEC school archives (HTML) - Fixed with proper tuple structure
@@ -507,8 +903,6 @@ REDDIT_FANTASY = [
 ]
 
 
-import httpx
-
 def discover_rss(base: str) -> str | None:
     """
     Try a handful of common RSS endpoints on a team site and return the first that looks valid.
@@ -519,21 +913,44 @@ def discover_rss(base: str) -> str | None:
         "/rss/team-news", "/media/rss", "/rss/feeds/news",
     ]
     headers = {
-        "User-Agent": "Mozilla/5.0 DelphiEdgeScraper/1.0",
         "Accept": "application/rss+xml, application/xml;q=0.9, */*;q=0.8",
     }
-    with httpx.Client(timeout=8.0, follow_redirects=True, headers=headers) as client:
-        for path in candidates:
-            url = base.rstrip("/") + path
-            try:
-                r = client.get(url)
-                if r.status_code == 200:
-                    ct = (r.headers.get("content-type") or "").lower()
-                    txt = r.text.lstrip()
-                    if ("xml" in ct or "rss" in ct or txt.startswith("<?xml")) and "<rss" in txt[:2000].lower():
-                        return url
-            except Exception:
-                continue
+
+    def _probe(url: str) -> str | None:
+        # Cheap HEAD first: a 404 or an HTML content-type rules the path out
+        # without downloading any body.
+        try:
+            r = _head(url, timeout=8.0, headers=headers)
+            if r.status_code != 200:
+                return None
+            ct = (r.headers.get("content-type") or "").lower()
+            if "xml" not in ct and "rss" not in ct:
+                return None
+            return url
+        except Exception:
+            return None
+
+    def _confirm(url: str) -> bool:
+        try:
+            r = _get(url, timeout=8.0, headers=headers)
+            if r.status_code != 200:
+                return False
+            txt = r.text.lstrip()
+            return "<rss" in txt[:2000].lower()
+        except Exception:
+            return False
+
+    urls = [base.rstrip("/") + path for path in candidates]
+    # Probe every candidate concurrently instead of serially eating one
+    # round trip per path; the first confirmed hit wins.
+    with ThreadPoolExecutor(max_workers=len(urls)) as pool:
+        futures = [pool.submit(_probe, u) for u in urls]
+        for fut in as_completed(futures):
+            hit = fut.result()
+            if hit and _confirm(hit):
+                for other in futures:
+                    other.cancel()
+                return hit
     return None
 
 # --- Yahoo Sports Feeds ---
@@ -541,180 +958,229 @@ YAHOO_NFL = "https://sports.yahoo.com/nfl/rss.xml"
 YAHOO_CFB = "https://sports.yahoo.com/college-football/rss.xml"
 
 # --- Local / Beat Writer feeds via Google News ---
-LOCAL_NEWS = [
-    google_news_feed("New Orleans Saints football", "TEAM Saints"),
-    google_news_feed("Atlanta Falcons football", "TEAM Falcons"),
-    google_news_feed("Tampa Bay Buccaneers football", "TEAM Buccaneers"),
-    google_news_feed("Baltimore Ravens football", "TEAM Ravens"),
-    google_news_feed("New England Patriots football", "TEAM Patriots"),
-    google_news_feed("Buffalo Bills football", "TEAM Bills"),
-    google_news_feed("Arizona Cardinals football", "TEAM Cardinals"),
-    google_news_feed("Atlanta Falcons football", "TEAM Falcons"),
-    google_news_feed("Baltimore Ravens football", "TEAM Ravens"),
-    google_news_feed("Buffalo Bills football", "TEAM Bills"),
-    google_news_feed("Carolina Panthers football", "TEAM Panthers"),
-    google_news_feed("Chicago Bears football", "TEAM Bears"),
-    google_news_feed("Cincinnati Bengals football", "TEAM Bengals"),
-    google_news_feed("Cleveland Browns football", "TEAM Browns"),
-    google_news_feed("Dallas Cowboys football", "TEAM Cowboys"),
-    google_news_feed("Denver Broncos football", "TEAM Broncos"),
-    google_news_feed("Detroit Lions football", "TEAM Lions"),
-    google_news_feed("Green Bay Packers football", "TEAM Packers"),
-    google_news_feed("Houston Texans football", "TEAM Texans"),
-    google_news_feed("Indianapolis Colts football", "TEAM Colts"),
-    google_news_feed("Jacksonville Jaguars football", "TEAM Jaguars"),
-    google_news_feed("Kansas City Chiefs football", "TEAM Chiefs"),
-    google_news_feed("Las Vegas Raiders football", "TEAM Raiders"),
-    google_news_feed("Los Angeles Chargers football", "TEAM Chargers"),
-    google_news_feed("Los Angeles Rams football", "TEAM Rams"),
-    google_news_feed("Miami Dolphins football", "TEAM Dolphins"),
-    google_news_feed("Minnesota Vikings football", "TEAM Vikings"),
-    google_news_feed("New England Patriots football", "TEAM Patriots"),
-    google_news_feed("New Orleans Saints football", "TEAM Saints"),
-    google_news_feed("New York Giants football", "TEAM Giants"),
-    google_news_feed("New York Jets football", "TEAM Jets"),
-    google_news_feed("Philadelphia Eagles football", "TEAM Eagles"),
-    google_news_feed("Pittsburgh Steelers football", "TEAM Steelers"),
-    google_news_feed("San Francisco 49ers football", "TEAM 49ers"),
-    google_news_feed("Seattle Seahawks football", "TEAM Seahawks"),
-    google_news_feed("Tampa Bay Buccaneers football", "TEAM Buccaneers"),
-    google_news_feed("Tennessee Titans football", "TEAM Titans"),
-    google_news_feed("Washington Commanders football", "TEAM Commanders"),
-]
-
-
-    # SEC Examples
-    google_news_feed("Alabama Crimson Tide football", "TEAM Alabama"),
-    google_news_feed("Georgia Bulldogs football", "TEAM Georgia"),
-    google_news_feed("LSU Tigers football", "TEAM LSU"),
-    google_news_feed("South Carolina Gamecocks football", "TEAM South Carolina"),
-    google_news_feed("Florida Gators football", "TEAM Florida"),
-    google_news_feed("Arkansas Razorbacks football", "TEAM Arkansas"),
-    google_news_feed("Auburn Tigers football", "TEAM Auburn"),
-    google_news_feed("Ole Miss Rebels football", "TEAM Ole Miss"),
-    google_news_feed("Mississippi State Bulldogs football", "TEAM Mississippi State"),
-    google_news_feed("Tennessee Volunteers football", "TEAM Tennessee"),
-    google_news_feed("Kentucky Wildcats football", "TEAM Kentucky"),
-    google_news_feed("Vanderbilt Commodores football", "TEAM Vanderbilt"),
-    google_news_feed("Missouri Tigers football", "TEAM Missouri"),
-    google_news_feed("Texas Longhorns football", "TEAM Texas"),
-    google_news_feed("Oklahoma Sooners football", "TEAM Oklahoma"),
-
-    # Big Ten Examples
-    google_news_feed("Michigan Wolverines football", "TEAM Michigan"),
-    google_news_feed("Ohio State Buckeyes football", "TEAM Ohio State"),
-    google_news_feed("Penn State Nittany Lions football", "TEAM Penn State"),
-    google_news_feed("Wisconsin Badgers football", "TEAM Wisconsin"),
-    google_news_feed("Michigan Wolverines football", "TEAM Michigan"),
-    google_news_feed("Ohio State Buckeyes football", "TEAM Ohio State"),
-    google_news_feed("Penn State Nittany Lions football", "TEAM Penn State"),
-    google_news_feed("Wisconsin Badgers football", "TEAM Wisconsin"),
-    google_news_feed("Iowa Hawkeyes football", "TEAM Iowa"),
-    google_news_feed("Minnesota Golden Gophers football", "TEAM Minnesota"),
-    google_news_feed("Nebraska Cornhuskers football", "TEAM Nebraska"),
-    google_news_feed("Illinois Fighting Illini football", "TEAM Illinois"),
-    google_news_feed("Indiana Hoosiers football", "TEAM Indiana"),
-    google_news_feed("Michigan State Spartans football", "TEAM Michigan State"),
-    google_news_feed("Northwestern Wildcats football", "TEAM Northwestern"),
-    google_news_feed("Maryland Terrapins football", "TEAM Maryland"),
-    google_news_feed("Rutgers Scarlet Knights football", "TEAM Rutgers"),
-    google_news_feed("USC Trojans football", "TEAM USC"),
-    google_news_feed("UCLA Bruins football", "TEAM UCLA"),
-    google_news_feed("Oregon Ducks football", "TEAM Oregon"),
-    google_news_feed("Washington Huskies football", "TEAM Washington"),
-]
+# (long name for the search query, short name for the tag). dict.fromkeys
+# drops accidental duplicate rows while preserving order; the feed list
+# itself is then a single comprehension instead of ~70 hand-written calls.
+LOCAL_TEAMS = list(dict.fromkeys([
+    # NFL
+    ("New Orleans Saints", "Saints"),
+    ("Atlanta Falcons", "Falcons"),
+    ("Tampa Bay Buccaneers", "Buccaneers"),
+    ("Baltimore Ravens", "Ravens"),
+    ("New England Patriots", "Patriots"),
+    ("Buffalo Bills", "Bills"),
+    ("Arizona Cardinals", "Cardinals"),
+    ("Carolina Panthers", "Panthers"),
+    ("Chicago Bears", "Bears"),
+    ("Cincinnati Bengals", "Bengals"),
+    ("Cleveland Browns", "Browns"),
+    ("Dallas Cowboys", "Cowboys"),
+    ("Denver Broncos", "Broncos"),
+    ("Detroit Lions", "Lions"),
+    ("Green Bay Packers", "Packers"),
+    ("Houston Texans", "Texans"),
+    ("Indianapolis Colts", "Colts"),
+    ("Jacksonville Jaguars", "Jaguars"),
+    ("Kansas City Chiefs", "Chiefs"),
+    ("Las Vegas Raiders", "Raiders"),
+    ("Los Angeles Chargers", "Chargers"),
+    ("Los Angeles Rams", "Rams"),
+    ("Miami Dolphins", "Dolphins"),
+    ("Minnesota Vikings", "Vikings"),
+    ("New York Giants", "Giants"),
+    ("New York Jets", "Jets"),
+    ("Philadelphia Eagles", "Eagles"),
+    ("Pittsburgh Steelers", "Steelers"),
+    ("San Francisco 49ers", "49ers"),
+    ("Seattle Seahawks", "Seahawks"),
+    ("Tennessee Titans", "Titans"),
+    ("Washington Commanders", "Commanders"),
+
+    # SEC
+    ("Alabama Crimson Tide", "Alabama"),
+    ("Georgia Bulldogs", "Georgia"),
+    ("LSU Tigers", "LSU"),
+    ("South Carolina Gamecocks", "South Carolina"),
+    ("Florida Gators", "Florida"),
+    ("Arkansas Razorbacks", "Arkansas"),
+    ("Auburn Tigers", "Auburn"),
+    ("Ole Miss Rebels", "Ole Miss"),
+    ("Mississippi State Bulldogs", "Mississippi State"),
+    ("Tennessee Volunteers", "Tennessee"),
+    ("Kentucky Wildcats", "Kentucky"),
+    ("Vanderbilt Commodores", "Vanderbilt"),
+    ("Missouri Tigers", "Missouri"),
+    ("Texas Longhorns", "Texas"),
+    ("Oklahoma Sooners", "Oklahoma"),
+
+    # Big Ten
+    ("Michigan Wolverines", "Michigan"),
+    ("Ohio State Buckeyes", "Ohio State"),
+    ("Penn State Nittany Lions", "Penn State"),
+    ("Wisconsin Badgers", "Wisconsin"),
+    ("Iowa Hawkeyes", "Iowa"),
+    ("Minnesota Golden Gophers", "Minnesota"),
+    ("Nebraska Cornhuskers", "Nebraska"),
+    ("Illinois Fighting Illini", "Illinois"),
+    ("Indiana Hoosiers", "Indiana"),
+    ("Michigan State Spartans", "Michigan State"),
+    ("Northwestern Wildcats", "Northwestern"),
+    ("Maryland Terrapins", "Maryland"),
+    ("Rutgers Scarlet Knights", "Rutgers"),
+    ("USC Trojans", "USC"),
+    ("UCLA Bruins", "UCLA"),
+    ("Oregon Ducks", "Oregon"),
+    ("Washington Huskies", "Washington"),
+]))
+
+LOCAL_NEWS = [google_news_feed(f"{team} football", f"TEAM {short}")
+              for team, short in LOCAL_TEAMS]
 
 
 
 
 # ------------------ Main -----------------------
-def main():
-    print(">>> Starting DelphiEdge scraper...")
-    init_db()
-    items: list[Article] = []
-
-    with open("feeds.json", "r", encoding="utf-8") as f:
-        feeds = json.load(f)
-
-    # ESPN & Reddit (football only)
-    items += rss_to_articles(ESPN_NFL, "https://www.espn.com", ["ESPN","NFL"])
-    items += rss_to_articles(ESPN_CFB, "https://www.espn.com", ["ESPN","CFB"])
-    items += rss_to_articles(R_CFB, "https://www.reddit.com", ["Reddit","CFB"])
-
-    # NFL team news (RSS)
-    for feed_url, source, tags in NFL_TEAM_FEEDS:
-        items += rss_to_articles(feed_url, source, tags)
-
-    # Ingest every feed listed in feeds.json (RSS-only, super reliable)
-    for feed in feeds:
-        items += rss_to_articles(
-            feed_url=feed["url"],
-            source=feed["source"],
-            default_tags=feed.get("tags")
-        )
-
-    # SEC schools (HTML archives) - Fixed indentation and structure
-    for url, source, sel, tags, allow_list, deny_list in SEC_ARCHIVES:
-        scraped = scrape_links(url, source, sel, tags, allow_list, deny_list)
-        items += scraped
-
-    for url, source, sel, tags in BIG10_ARCHIVES:
-        items += scrape_links(url, source, sel, tags)
+def _collect_feed_jobs() -> list[dict]:
+    """Flatten every RSS feed collection into one job list for the pool.
 
-    for url, source, tags in BIG12_ARCHIVES:
-        items += scrape_sidearm(url, source, tags)
-
-    for url, source, tags in ACC_ARCHIVES:
-        items += scrape_sidearm(url, source, tags)
-
-    for url, source, tags in PAC_ARCHIVES:
-        items += scrape_sidearm(url, source, tags)
+    One flat list means a single concurrent fetch phase instead of a dozen
+    serial loops, each blocking on its own round trips.
+    """
+    jobs: list[dict] = [
+        # ESPN & Reddit (football only)
+        {"url": ESPN_NFL, "source": "https://www.espn.com", "tags": ["ESPN","NFL"]},
+        {"url": ESPN_CFB, "source": "https://www.espn.com", "tags": ["ESPN","CFB"]},
+        {"url": R_CFB,    "source": "https://www.reddit.com", "tags": ["Reddit","CFB"]},
+        # Florida via RSS (recommended)
+        {"url": "https://floridagators.com/rss.aspx?path=football",
+         "source": "https://floridagators.com", "tags": ["TEAM","Florida"]},
+    ]
 
-    for url, source, tags in MWC_ARCHIVES:
-        items += scrape_sidearm(url, source, tags)
+    # Yahoo & CBS headline feeds
+    jobs += EXTRA_RSS
 
-    for url, source, tags in LOCAL_NEWS:
-        items += scrape_rss(url, source, tags)
+    # Every feed listed in feeds.json (RSS-only, super reliable) — this
+    # already covers the Reddit team subs.
+    jobs += load_feeds_json()
 
     for url, source, tags in LOCAL_NEWS:
-        items += rss_to_articles(url, source, tags)
-
+        jobs.append({"url": url, "source": source, "tags": tags})
     for url, source, tags in FANTASY_NFL + BETTING_NFL + FANTASY_CFB + BETTING_CFB:
-        items += rss_to_articles(url, source, tags)
-
-# (optional)
+        jobs.append({"url": url, "source": source, "tags": tags})
     for url, source, tags in REDDIT_FANTASY:
-        items += rss_to_articles(url, source, tags)
+        jobs.append({"url": url, "source": source, "tags": tags})
+
+    # NFL team sites publish no consistent feed path; probe each domain
+    # concurrently and ingest whatever turns up.
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        discovered = list(pool.map(discover_rss, (base for base, _ in NFL_TEAM_DOMAINS)))
+    for (base, tags), feed_url in zip(NFL_TEAM_DOMAINS, discovered):
+        if feed_url:
+            jobs.append({"url": feed_url, "source": base, "tags": tags})
+
+    # The collections overlap (shared Google News queries, Reddit subs that
+    # also appear in feeds.json); every duplicate URL is a wasted fetch and
+    # parse, so keep only the first job per URL.
+    seen: set[str] = set()
+    unique_jobs: list[dict] = []
+    for job in jobs:
+        url = (job.get("url") or "").strip()
+        if url and url not in seen:
+            seen.add(url)
+            unique_jobs.append(job)
+    return unique_jobs
+
+def _collect_scrape_jobs() -> list[tuple]:
+    """Normalize the HTML archive tables to scrape_links argument tuples."""
+    jobs: list[tuple] = []
+    # SEC rows carry optional allow/deny lists; the older entries have them,
+    # the newer ones don't.
+    for entry in SEC_ARCHIVES:
+        url, source, sel, tags = entry[:4]
+        allow_list = entry[4] if len(entry) > 4 else None
+        deny_list = entry[5] if len(entry) > 5 else None
+        jobs.append((url, source, sel, tags, allow_list, deny_list))
+    for url, source, sel, tags in BIG10_ARCHIVES:
+        jobs.append((url, source, sel, tags, None, None))
+    for url, source, tags in BIG12_ARCHIVES + ACC_ARCHIVES + PAC_ARCHIVES + MWC_ARCHIVES:
+        jobs.append((url, source, "a[href*='/news/']", tags, None, None))
+    return jobs
 
+def filter_unique(seen: set[str], new_items: list[Article]) -> list[Article]:
+    """Return only the articles whose canonical URL hasn't been seen this run.
+
+    Feeds re-syndicate the same stories heavily; dropping duplicates before
+    they reach the DB queue keeps the batches proportional to unique
+    stories instead of raw feed volume.
+    """
+    fresh: list[Article] = []
+    for a in new_items:
+        key = canonicalize(a.url)
+        if key not in seen:
+            seen.add(key)
+            fresh.append(a)
+    return fresh
+
+def _drain_to_db(q: "queue.Queue[list[Article] | None]", flush_every: int = 1000) -> int:
+    """Single DB-writer loop: buffer queued article batches, upsert periodically.
+
+    A lone writer keeps SQLite's single-writer semantics trivial while the
+    fetch threads keep producing; flushing every `flush_every` rows bounds
+    how many articles are ever buffered in memory. A None batch is the
+    shutdown sentinel. Returns the total rows written.
+    """
+    buf: list[Article] = []
+    total = 0
+    while True:
+        batch = q.get()
+        if batch is None:
+            break
+        buf.extend(batch)
+        if len(buf) >= flush_every:
+            upsert(buf)
+            total += len(buf)
+            buf.clear()
+    if buf:
+        upsert(buf)
+        total += len(buf)
+    return total
 
+def main():
+    print(">>> Starting DelphiEdge scraper...")
+    init_db()
+    seen_urls: set[str] = set()
 
+    # Articles stream to a single DB-writer thread as each feed/page
+    # completes, so SQLite work overlaps the network fetches and peak
+    # memory is one buffered batch rather than the whole run's items.
+    q: "queue.Queue[list[Article] | None]" = queue.Queue(maxsize=32)
 
+    def sink(new_items: list[Article]) -> None:
+        fresh = filter_unique(seen_urls, new_items)
+        if fresh:
+            q.put(fresh)
 
-    # Florida via RSS (recommended)
-    items += rss_to_articles(
-        "https://floridagators.com/rss.aspx?path=football",
-        "https://floridagators.com",
-        ["TEAM","Florida"]
-    )
+    with ThreadPoolExecutor(max_workers=1) as writer_pool:
+        writer = writer_pool.submit(_drain_to_db, q)
 
-        # Yahoo Sports
-    items += rss_to_articles(YAHOO_NFL, "https://sports.yahoo.com", ["Yahoo","NFL"])
-    items += rss_to_articles(YAHOO_CFB, "https://sports.yahoo.com", ["Yahoo","CFB"])
+        # RSS phase: every feed fetched concurrently off one flat job list.
+        ingest_feeds_with_logging(_collect_feed_jobs(), sink=sink)
 
-    # Log + ingest Reddit feeds from feeds.json (team subs, r/NFL, r/CFBAnalysis, etc.)
-extra_feeds = load_feeds_json()
-reddit_feeds = [f for f in extra_feeds if "reddit.com" in (f.get("url","").lower())]
-if reddit_feeds:
-    items += ingest_feeds_with_logging(reddit_feeds, label_prefix="Reddit")
+        # HTML phase: the archive scrapes are just as I/O-bound, so pool them too.
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            futures = [pool.submit(scrape_links, *job) for job in _collect_scrape_jobs()]
+            for fut in as_completed(futures):
+                sink(fut.result())
 
+        q.put(None)
+        saved = writer.result()
 
-    if not items:
+    if not saved:
         print(">>> No items found")
         return
 
-    upsert(items)
     export_csv()
-    print(f">>> DONE. Saved {len(items)} items to {DB_PATH} and {CSV_PATH}")
+    print(f">>> DONE. Saved {saved} items to {DB_PATH} and {CSV_PATH}")
 
 if __name__ == "__main__":
     main()